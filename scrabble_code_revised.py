@@ -1,4 +1,5 @@
-from random import shuffle
+from collections import Counter
+from random import getrandbits
 
 # ANSI escape codes for colored text
 RED_TEXT = "\033[1;31m"
@@ -18,7 +19,7 @@ Classes:
 - Tile: Represents a single tile with a letter and its score.
 - Rack: Manages the player's tile rack (their hand of tiles).
 - Bag: Represents the pool of tiles available for the game.
-- Word: Handles word validation and scoring.
+- Word: Handles word validation.
 - Board: Manages the Scrabble board, including placement and premium squares.
 - Player: Represents a player with a rack, score, and name.
 
@@ -35,6 +36,61 @@ LETTER_VALUES = {
     "S": 1, "T": 1, "U": 1, "V": 4, "W": 4, "X": 8, "Y": 4, "Z": 10
 } 
 
+# Number of tiles of each letter in a full bag. This is the original game's
+# distribution, kept on purpose: it has 9 J tiles rather than the standard 1,
+# so the bag holds 106 tiles instead of 100.
+TILE_DISTRIBUTION = {
+    "A": 9, "B": 2, "C": 2, "D": 4, "E": 12, "F": 2, "G": 3, "H": 2, "I": 9,
+    "J": 9, "K": 1, "L": 4, "M": 2, "N": 6, "O": 8, "P": 2, "Q": 1, "R": 6,
+    "S": 4, "T": 6, "U": 4, "V": 2, "W": 2, "X": 1, "Y": 2, "Z": 1
+}
+
+# Set of valid words, loaded once so each lookup is a single hash probe
+with open("dic.txt") as dictionary_file:
+    DICTIONARY = frozenset(line.strip().upper() for line in dictionary_file)
+
+# Coordinates (row, col) of each type of premium square
+TRIPLE_WORD_SCORE = ((0,0), (7, 0), (14,0), (0, 7), (14, 7), (0, 14), (7, 14), (14,14))
+DOUBLE_WORD_SCORE = ((1,1), (2,2), (3,3), (4,4), (1, 13), (2, 12), (3, 11), (4, 10), (13, 1), (12, 2), (11, 3), (10, 4), (13,13), (12, 12), (11,11), (10,10))
+TRIPLE_LETTER_SCORE = ((1,5), (1, 9), (5,1), (5,5), (5,9), (5,13), (9,1), (9,5), (9,9), (9,13), (13, 5), (13,9))
+DOUBLE_LETTER_SCORE = ((0, 3), (0,11), (2,6), (2,8), (3,0), (3,7), (3,14), (6,2), (6,6), (6,8), (6,12), (7,3), (7,11), (8,2), (8,6), (8,8), (8, 12), (11,0), (11,7), (11,14), (12,6), (12,8), (14, 3), (14, 11))
+
+# Score multipliers applied by each type of premium square
+LETTER_MULTIPLIERS = {"TLS": 3, "DLS": 2}
+WORD_MULTIPLIERS = {"TWS": 3, "DWS": 2}
+
+# Pre-built display strings for letters on the board, letters in a rack and premium squares
+LETTER_GLYPHS = {letter: f" {RED_TEXT}{letter}{RESET_TEXT} " for letter in LETTER_VALUES}
+RACK_GLYPHS = {letter: f"{YELLOW_TEXT}{letter}{RESET_TEXT}" for letter in LETTER_VALUES}
+PREMIUM_GLYPHS = {
+    "TWS": f"{LIGHT_BLUE_TEXT}TWS{RESET_TEXT}",
+    "DWS": f"{LIGHT_CYAN_TEXT}DWS{RESET_TEXT}",
+    "TLS": f"{BLUE_TEXT}TLS{RESET_TEXT}",
+    "DLS": f"{CYAN_TEXT}DLS{RESET_TEXT}",
+    "*": f"{RED_TEXT} * {RESET_TEXT}",
+}
+
+# Row and column numbers accepted as input
+_VALID_COORDS = frozenset(str(x) for x in range(15))
+
+def _fast_shuffle(items):
+    """
+    Shuffles a list in place using the Fisher-Yates algorithm.
+
+    Random indices are drawn with Lemire's multiply-and-shift method, which
+    replaces the modulo of the usual bounded random integer with a multiplication
+    and only rejects a sample (to stay unbiased) in rare cases.
+    """
+    for i in range(len(items) - 1, 0, -1):
+        bound = i + 1
+        product = getrandbits(32) * bound
+        if (product & 0xFFFFFFFF) < bound:
+            threshold = (1 << 32) % bound
+            while (product & 0xFFFFFFFF) < threshold:
+                product = getrandbits(32) * bound
+        j = product >> 32
+        items[i], items[j] = items[j], items[i]
+
 class Tile:
     """
     Represents a single Scrabble tile.
@@ -43,17 +99,30 @@ class Tile:
     - letter: The letter on the tile (uppercase).
     - score: The point value of the letter.
 
+    Tiles with the same letter are interchangeable, so Tile.get shares a single
+    instance per letter instead of creating a new tile for every copy in the bag.
+
     Methods:
+    - get: Returns the shared tile for a letter.
     - get_letter: Returns the tile's letter.
     - get_score: Returns the tile's score.
     """
-    def __init__(self, letter, letter_values):
+    __slots__ = ("letter", "score")
+
+    _cache = {}  # Shared tile for each letter, filled in by get()
+
+    def __init__(self, letter):
         # Initialize the tile with a letter and its score from LETTER_VALUES.
         self.letter = letter.upper()
-        if self.letter in letter_values:
-            self.score = letter_values[self.letter]
-        else:
-            self.score = 0
+        self.score = LETTER_VALUES.get(self.letter, 0)
+
+    @classmethod
+    def get(cls, letter):
+        # Returns the shared tile for the given letter, creating it on first use.
+        letter = letter.upper()
+        if letter not in cls._cache:
+            cls._cache[letter] = cls(letter)
+        return cls._cache[letter]
 
     def get_letter(self):
         return self.letter
@@ -66,58 +135,32 @@ class Bag:
     Represents the bag containing all Scrabble tiles.
 
     Methods:
-    - add_to_bag: Adds a specified quantity of a tile to the bag.
     - initialize_bag: Fills the bag with the default distribution of tiles.
-    - take_from_bag: Removes and returns a random tile from the bag.
+    - take_from_bag: Removes and returns a random tile from the bag, or None if it is empty.
+    - return_tiles: Puts tiles back into the bag and shuffles it.
     - get_remaining_tiles: Returns the count of remaining tiles.
     """
+    __slots__ = ("bag",)
     def __init__(self):
-        #Creates the bag full of game tiles, and calls the initialize_bag() method, which adds the default 100 tiles to the bag.
+        #Creates the bag full of game tiles by calling the initialize_bag() method, which fills it from TILE_DISTRIBUTION.
         #Takes no arguments.
-        self.bag = [] # List to store tiles
         self.initialize_bag()
 
-    def add_to_bag(self, tile, quantity):
-        #Adds a certain quantity of a certain tile to the bag. Takes a tile and an integer quantity as arguments.
-        for i in range(quantity):
-            self.bag.append(tile)
-
     def initialize_bag(self):
-        # Add tiles to the bag based on the standard Scrabble distribution.
-        global LETTER_VALUES
-        self.add_to_bag(Tile("A", LETTER_VALUES), 9)
-        self.add_to_bag(Tile("B", LETTER_VALUES), 2)
-        self.add_to_bag(Tile("C", LETTER_VALUES), 2)
-        self.add_to_bag(Tile("D", LETTER_VALUES), 4)
-        self.add_to_bag(Tile("E", LETTER_VALUES), 12)
-        self.add_to_bag(Tile("F", LETTER_VALUES), 2)
-        self.add_to_bag(Tile("G", LETTER_VALUES), 3)
-        self.add_to_bag(Tile("H", LETTER_VALUES), 2)
-        self.add_to_bag(Tile("I", LETTER_VALUES), 9)
-        self.add_to_bag(Tile("J", LETTER_VALUES), 9)
-        self.add_to_bag(Tile("K", LETTER_VALUES), 1)
-        self.add_to_bag(Tile("L", LETTER_VALUES), 4)
-        self.add_to_bag(Tile("M", LETTER_VALUES), 2)
-        self.add_to_bag(Tile("N", LETTER_VALUES), 6)
-        self.add_to_bag(Tile("O", LETTER_VALUES), 8)
-        self.add_to_bag(Tile("P", LETTER_VALUES), 2)
-        self.add_to_bag(Tile("Q", LETTER_VALUES), 1)
-        self.add_to_bag(Tile("R", LETTER_VALUES), 6)
-        self.add_to_bag(Tile("S", LETTER_VALUES), 4)
-        self.add_to_bag(Tile("T", LETTER_VALUES), 6)
-        self.add_to_bag(Tile("U", LETTER_VALUES), 4)
-        self.add_to_bag(Tile("V", LETTER_VALUES), 2)
-        self.add_to_bag(Tile("W", LETTER_VALUES), 2)
-        self.add_to_bag(Tile("X", LETTER_VALUES), 1)
-        self.add_to_bag(Tile("Y", LETTER_VALUES), 2)
-        self.add_to_bag(Tile("Z", LETTER_VALUES), 1)
-        shuffle(self.bag)
+        # Fill the bag (a list of tiles) based on TILE_DISTRIBUTION.
+        self.bag = [Tile.get(letter) for letter, quantity in TILE_DISTRIBUTION.items() for i in range(quantity)]
+        if len(self.bag) > 1:
+            _fast_shuffle(self.bag)
 
     def take_from_bag(self):
-        # Draws a tile from the bag. If the bag is nearly empty, refill it.
-        if len(self.bag) < 10:  
-            self.initialize_bag()  
-        return self.bag.pop()
+        # Draws a tile from the bag. Returns None once the bag is empty.
+        return self.bag.pop() if self.bag else None
+
+    def return_tiles(self, tiles):
+        # Puts tiles back into the bag and shuffles them in with the rest.
+        self.bag.extend(tiles)
+        if len(self.bag) > 1:
+            _fast_shuffle(self.bag)
 
     def get_remaining_tiles(self):
         #Returns the number of tiles left in the bag.
@@ -129,33 +172,44 @@ class Rack:
     Represents a player's rack (hand of tiles).
 
     Methods:
-    - add_to_rack: Draws a tile from the bag and adds it to the rack.
+    - add_to_rack: Draws a tile from the bag and adds it to the rack. Returns False if the bag is empty.
     - initialize: Fills the rack with the initial 7 tiles.
     - get_rack_str: Returns a string representation of the rack.
     - get_rack_arr: Returns the rack as a list of tile objects.
+    - get_letter_counts: Returns a Counter of the letters in the rack.
     - remove_from_rack: Removes a specified tile from the rack.
     - replenish_rack: Refills the rack to 7 tiles if possible.
+    - renew_rack: Returns all tiles to the bag and draws a new rack.
     - shuffle_rack: Randomly rearranges the tiles in the rack.
     """
+    __slots__ = ("rack", "bag")
     def __init__(self, bag):
         self.rack = []  # List to store the player's tiles
         self.bag = bag
         self.initialize()
 
     def add_to_rack(self):
-        self.rack.append(self.bag.take_from_bag())
+        tile = self.bag.take_from_bag()
+        if tile is None:
+            return False
+        self.rack.append(tile)
+        return True
 
     def initialize(self):
         for i in range(7):
-            self.add_to_rack()
+            if not self.add_to_rack():
+                break
 
     def get_rack_str(self):
         # Returns the rack as a comma-separated string with colored letters.
-        return ", ".join(f"{YELLOW_TEXT}{str(item.get_letter())}{RESET_TEXT}" for item in self.rack)
+        return ", ".join(RACK_GLYPHS[item.get_letter()] for item in self.rack)
 
     def get_rack_arr(self):
         return self.rack
 
+    def get_letter_counts(self):
+        return Counter(tile.get_letter() for tile in self.rack)
+
     def remove_from_rack(self, tile):
         self.rack.remove(tile)
 
@@ -163,11 +217,19 @@ class Rack:
         return len(self.rack)
 
     def replenish_rack(self):
-        while self.get_rack_length() < 7 and self.bag.get_remaining_tiles() > 0:
-            self.add_to_rack()
+        while self.get_rack_length() < 7:
+            if not self.add_to_rack():
+                break
+
+    def renew_rack(self):
+        self.bag.return_tiles(self.rack)
+        self.rack.clear()
+        self.replenish_rack()
      
     def shuffle_rack(self):
-        shuffle(self.rack)
+        # Empty and single-tile racks have nothing to shuffle.
+        if len(self.rack) > 1:
+            _fast_shuffle(self.rack)
         
 
 class Player:
@@ -184,9 +246,11 @@ class Player:
     - get_name: Retrieves the player's name.
     - get_rack_str: Returns the player's rack as a formatted string.
     - get_rack_arr: Returns the player's rack as a list of Tile objects.
+    - get_letter_counts: Returns a Counter of the letters in the player's rack.
     - increase_score: Adds points to the player's score.
     - get_score: Retrieves the player's current score.
     """
+    __slots__ = ("name", "rack", "score")
     def __init__(self, bag):
         # Initialize a player with an empty name, a rack from the given bag, and a score of 0.
         self.name = ""
@@ -205,6 +269,9 @@ class Player:
     def get_rack_arr(self):
         return self.rack.get_rack_arr()
 
+    def get_letter_counts(self):
+        return self.rack.get_letter_counts()
+
     def increase_score(self, increase):
         self.score += increase
 
@@ -219,87 +286,133 @@ class Board:
     Represents the Scrabble board.
 
     Attributes:
-    - board: A 15x15 grid initialized with empty spaces and premium square indicators.
+    - board: A 15x15 grid of the glyphs displayed in each square.
+    - cells: The letters on the board as a flat bytearray indexed by row * 15 + col,
+      holding 0 for an empty square and 1-26 for the letters A-Z.
+    - premium: Maps (row, col) to the premium square type ("TWS", "DWS", "TLS", "DLS" or "*")
+      of every square that has not been covered yet.
 
     Methods:
     - get_board: Returns a formatted string representation of the board.
     - add_premium_squares: Adds premium squares (e.g., double/triple word/letter scores) to the board.
-    - place_word: Places a word on the board and updates the player's rack.
-    - board_array: Returns the raw 2D array representation of the board.
+    - read_squares: Returns the letters already under a word and the tiles needed to complete it.
+    - place_word: Places a word on the board, updates the player's rack and returns the word's score.
     """
+    __slots__ = ("board", "cells", "premium", "_dirty", "_cached_str")
+
+    # Column numbers and separator lines used when displaying the board
+    _HEADER = "   |  " + "  |  ".join(str(item) for item in range(10)) + "  | " + "  | ".join(str(item) for item in range(10, 15)) + " |"
+    _SEP = "\n   _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _"
+    _ROW_SEP = "\n   |_ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _|\n"
+
     def __init__(self):
         # Initialize a 15x15 board and add premium squares.
         self.board = [["   " for i in range(15)] for j in range(15)]
+        self.cells = bytearray(225)
+        self.premium = {
+            coordinate: premium
+            for premium, coordinates in (
+                ("TWS", TRIPLE_WORD_SCORE),
+                ("DWS", DOUBLE_WORD_SCORE),
+                ("TLS", TRIPLE_LETTER_SCORE),
+                ("DLS", DOUBLE_LETTER_SCORE),
+                ("*", ((7, 7),)),
+            )
+            for coordinate in coordinates
+        }
         self.add_premium_squares()
-        self.board[7][7]  = f"{RED_TEXT} * {RESET_TEXT}"
+        self._dirty = True  # Whether the board changed since _cached_str was built
+        self._cached_str = ""
 
     def get_board(self):
-        # Returns the board as a formatted string for display.
-        board_str = "   |  " + "  |  ".join(str(item) for item in range(10)) + "  | " + "  | ".join(str(item) for item in range(10, 15)) + " |"
-        board_str += "\n   _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _\n"
-        board = list(self.board)
-        for i in range(len(board)):
-            if i < 10:
-                board[i] = str(i) + "  | " + " | ".join(str(item) for item in board[i]) + " |"
-            if i >= 10:
-                board[i] = str(i) + " | " + " | ".join(str(item) for item in board[i]) + " |"
-        board_str += "\n   |_ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _|\n".join(board)
-        board_str += "\n   _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _"
-        return board_str
+        # Returns the board as a formatted string for display, only rebuilding it after the board changes.
+        if not self._dirty:
+            return self._cached_str
+        parts = [self._HEADER, self._SEP, "\n"]
+        rows = [f"{i:<2} | " + " | ".join(row) + " |" for i, row in enumerate(self.board)]
+        parts.append(self._ROW_SEP.join(rows))
+        parts.append(self._SEP)
+        self._cached_str = "".join(parts)
+        self._dirty = False
+        return self._cached_str
 
     def add_premium_squares(self):
-        # Adds premium squares (e.g., TWS, DWS, TLS, DLS) to the board.
-        TRIPLE_WORD_SCORE = ((0,0), (7, 0), (14,0), (0, 7), (14, 7), (0, 14), (7, 14), (14,14))
-        DOUBLE_WORD_SCORE = ((1,1), (2,2), (3,3), (4,4), (1, 13), (2, 12), (3, 11), (4, 10), (13, 1), (12, 2), (11, 3), (10, 4), (13,13), (12, 12), (11,11), (10,10))
-        TRIPLE_LETTER_SCORE = ((1,5), (1, 9), (5,1), (5,5), (5,9), (5,13), (9,1), (9,5), (9,9), (9,13), (13, 5), (13,9))
-        DOUBLE_LETTER_SCORE = ((0, 3), (0,11), (2,6), (2,8), (3,0), (3,7), (3,14), (6,2), (6,6), (6,8), (6,12), (7,3), (7,11), (8,2), (8,6), (8,8), (8, 12), (11,0), (11,7), (11,14), (12,6), (12,8), (14, 3), (14, 11))
-
-        for coordinate in TRIPLE_WORD_SCORE:
-            self.board[coordinate[0]][coordinate[1]] = f"{LIGHT_BLUE_TEXT}TWS{RESET_TEXT}"
-        for coordinate in TRIPLE_LETTER_SCORE:
-            self.board[coordinate[0]][coordinate[1]] = f"{BLUE_TEXT}TLS{RESET_TEXT}"
-        for coordinate in DOUBLE_WORD_SCORE:
-            self.board[coordinate[0]][coordinate[1]] = f"{LIGHT_CYAN_TEXT}DWS{RESET_TEXT}"
-        for coordinate in DOUBLE_LETTER_SCORE:
-            self.board[coordinate[0]][coordinate[1]] = f"{CYAN_TEXT}DLS{RESET_TEXT}"
+        # Adds premium squares (e.g., TWS, DWS, TLS, DLS) and the center star to the board.
+        for coordinate, premium in self.premium.items():
+            self.board[coordinate[0]][coordinate[1]] = PREMIUM_GLYPHS[premium]
             
 
+    def read_squares(self, word, location, direction):
+        """
+        Reads the squares a word would cover, which must be on the board.
+
+        Returns:
+        - str: The letter on each square, or " " for an empty square.
+        - Counter: The letters of the word that go on empty squares, i.e. the tiles needed from a rack.
+        """
+        step = 1 if direction == "right" else 15  # Next square in the flat cells array
+        start = location[0]*15 + location[1]
+        board_letters = ""
+        needed_tiles = Counter()
+        for i in range(len(word)):
+            cell = self.cells[start + i*step]
+            if cell == 0:
+                board_letters += " "
+                needed_tiles[word[i]] += 1
+            else:
+                board_letters += chr(cell + 64)
+        return board_letters, needed_tiles
+
     def place_word(self, word, location, direction, player):
-        # Places a word on the board and updates the player's rack.
-        global premium_spots
-        premium_spots = []
+        """
+        Places a word on the board, updates the player's rack and returns the word's score.
+
+        Scoring Details:
+        - Each letter has a base score determined by LETTER_VALUES.
+        - Letter bonus squares (TLS, DLS) multiply the scores of individual letters.
+        - Word bonus squares (TWS, DWS) multiply the total word score.
+        - Premium squares are used up once covered, so they are removed from self.premium.
+        """
         direction = direction.lower()
         word = word.upper()
-        
-        # Place the word horizontally
-        if direction.lower() == "right":
-            for i in range(len(word)):
-                if self.board[location[0]][location[1]+i] != "   ":
-                    premium_spots.append((word[i], self.board[location[0]][location[1]+i]))
-                self.board[location[0]][location[1]+i] = f" {RED_TEXT}{word[i]}{RESET_TEXT} "
-
-        # Place the word vertically
-        elif direction.lower() == "down":
-            for i in range(len(word)):
-                if self.board[location[0]][location[1]+i] != "   ":
-                    premium_spots.append((word[i], self.board[location[0]][location[1]+i]))
-                self.board[location[0]+i][location[1]] = f" {RED_TEXT}{word[i]}{RESET_TEXT} "
-
-        # Update player's rack by removing used tiles
-        for letter in word:
-            for tile in player.get_rack_arr():
-                if tile.get_letter() == letter:
-                    player.rack.remove_from_rack(tile)
+        word_score = 0
+        word_multiplier = 1
+        needed_tiles = self.read_squares(word, location, direction)[1]  # Letters placed on empty squares, which come from the rack
+
+        for i in range(len(word)):
+            # Place the word horizontally or vertically
+            if direction == "right":
+                row, col = location[0], location[1]+i
+            elif direction == "down":
+                row, col = location[0]+i, location[1]
+            else:
+                break
+
+            # Add the letter's score and apply any premium square it covers
+            premium = self.premium.pop((row, col), None)
+            self.cells[row*15 + col] = ord(word[i]) - 64
+            word_score += LETTER_VALUES[word[i]] * LETTER_MULTIPLIERS.get(premium, 1)
+            word_multiplier *= WORD_MULTIPLIERS.get(premium, 1)
+            self.board[row][col] = LETTER_GLYPHS[word[i]]
+        self._dirty = True
+
+        # Update player's rack by removing one tile for each letter placed from it
+        remaining_tiles = []
+        for tile in player.get_rack_arr():
+            if needed_tiles[tile.get_letter()] > 0:
+                needed_tiles[tile.get_letter()] -= 1
+            else:
+                remaining_tiles.append(tile)
+        player.rack.rack = remaining_tiles
         player.rack.replenish_rack()
 
-    def board_array(self):
-        #Returns the 2-dimensional board array.
-        return self.board
+        return word_score * word_multiplier
 
 class Word:
     """
-    Handles validation and scoring of words in the Scrabble game.
+    Handles validation of words in the Scrabble game.
     """
+    __slots__ = ("word", "location", "player", "direction", "board")
 
     def __init__(self, word, location, player, direction, board):
         self.word = word.upper() # Store the word in uppercase
@@ -313,52 +426,40 @@ class Word:
         Validates the word for correct placement, overlap, and dictionary presence.
 
         Validation steps:
-        1. Ensures the word is placed in a valid direction (right or down).
+        1. Ensures the word is placed in a valid direction (right or down)
+           and fits within the board boundaries.
         2. Confirms the word exists in the dictionary.
         3. Checks overlapping letters on the board for consistency with the word being played.
         4. Ensures the word connects to existing letters on the board (after the first round).
         5. Validates the player has all necessary tiles to play the word.
-        6. Checks the word fits within the board boundaries.
-        7. Ensures the first word is placed at the center of the board (7,7).
+        6. Ensures the first word is placed at the center of the board (7,7).
 
         Returns:
         - True: If the word passes all validation checks.
         - str: Error message describing why the word is invalid.
         """
         global round_number, players
-        global dictionary
-        word_score = 0
-
-        # Initialize variables for validation
-        current_board_ltr = ""  # Letters already on the board that the word overlaps with
-        needed_tiles = ""  # Tiles the player needs to complete the word
-
-        # Load the dictionary if not already loaded
-        if "dictionary" not in globals():
-            dictionary = open("dic.txt").read().splitlines()
 
         # Validate word placement only if the word is not empty
         if self.word != "":
             # Check the direction of the word placement
-            if self.direction == "right":
-                for i in range(len(self.word)):
-                    board_tile = self.board[self.location[0]][self.location[1] + i]
-                    if board_tile.strip() in ["", "TWS", "DWS", "TLS", "DLS", "*"]:
-                        current_board_ltr += " " # Empty or premium square
-                    else:
-                        current_board_ltr += board_tile.strip()[1]   # Extract existing letter
-            elif self.direction == "down":
-                for i in range(len(self.word)):
-                    board_tile = self.board[self.location[0] + i][self.location[1]]
-                    if board_tile.strip() in ["", "TWS", "DWS", "TLS", "DLS", "*"]:
-                        current_board_ltr += " " 
-                    else:
-                        current_board_ltr += board_tile.strip()[1]  # Extract existing letter on board
-            else:
+            if self.direction not in ("right", "down"):
                 return "Error: Please enter a valid direction (right or down)."
 
+            # Ensure the word fits within the board boundaries before reading its squares
+            if (
+                self.location[0] < 0
+                or self.location[1] < 0
+                or (self.direction == "right" and self.location[1] + len(self.word) > 15)
+                or (self.direction == "down" and self.location[0] + len(self.word) > 15)
+            ):
+                return "The word placement is out of bounds."
+
+            # Letters already on the board that the word overlaps with, and tiles the player needs to complete the word
+            current_board_ltr, needed_tiles = self.board.read_squares(self.word, self.location, self.direction)
+
             # Validate that the word exists in the dictionary
-            if self.word not in dictionary:
+            if self.word not in DICTIONARY:
                 print("\n" + "Please enter a valid dictionary word!.")
                 print("Your score has been deducted.")
                 self.player.decrease_score()
@@ -366,31 +467,20 @@ class Word:
                 return "try again!\n"
                 
             # Ensure overlapping letters on the board match the word being played
-            if self.direction == "right":
-                for i, letter in enumerate(self.word):
-                    self.board[self.location[0]][self.location[1] + i] # Update board
-            elif self.direction == "down":
-                for i, letter in enumerate(self.word):
-                    self.board[self.location[0] + i][self.location[1]] # Update board
-                    
+            for letter, board_letter in zip(self.word, current_board_ltr):
+                if board_letter != " " and board_letter != letter:
+                    return "The word must match the letters already on the board."
+
             # Check if the word connects to existing letters on the board (after the first round)
             if round_number > 1 and current_board_ltr == " " * len(self.word):
                 return "The word must connect to an existing letter on the board."
 
             # Verify the player has all necessary tiles to play the word
-            for letter in needed_tiles:
-                if self.player.get_rack_str().count(letter) < needed_tiles.count(letter):
+            rack_tiles = self.player.get_letter_counts()
+            for letter, count in needed_tiles.items():
+                if rack_tiles[letter] < count:
                     return f"You do not have the necessary tiles to play the word '{self.word}'."
 
-            # Ensure the word fits within the board boundaries
-            if (
-                self.location[0] < 0
-                or self.location[1] < 0
-                or (self.direction == "right" and self.location[1] + len(self.word) > 15)
-                or (self.direction == "down" and self.location[0] + len(self.word) > 15)
-            ):
-                return "The word placement is out of bounds."
-
             # Verify the first word is placed at the center of the board (7,7)
             if round_number == 1 and players[0] == self.player and self.location != [7, 7]:
                 return "The first word must begin at the center of the board (7, 7)."
@@ -398,38 +488,6 @@ class Word:
             return True
 
 
-    def calculate_word_score(self):
-        """
-        Calculates the score of the word, including premium square bonuses.
-
-        Scoring Details:
-        - Each letter has a base score determined by LETTER_VALUES.
-        - Letter bonus squares (TLS, DLS) multiply the scores of individual letters.
-        - Word bonus squares (TWS, DWS) multiply the total word score.
-        """
-        global LETTER_VALUES, premium_spots
-        word_score = 0
-        
-        # Add base score for each letter and apply any applicable letter bonuses
-        for letter in self.word:
-            for spot in premium_spots:
-                if letter == spot[0]:
-                    if spot[1] == "TLS":
-                        word_score += LETTER_VALUES[letter] * 2
-                    elif spot[1] == "DLS":
-                        word_score += LETTER_VALUES[letter]
-            word_score += LETTER_VALUES[letter]
-            
-        # Apply word multipliers from premium squares
-        for spot in premium_spots:
-            if spot[1] == "TWS":
-                word_score *= 3
-            elif spot[1] == "DWS":
-                word_score *= 2
-                
-        # Update the player's score
-        self.player.increase_score(word_score)
-
     # Setter and getter methods for the word's attributes
     def set_word(self, word):
         self.word = word.upper()
@@ -438,61 +496,87 @@ class Word:
         self.location = location
 
     def set_direction(self, direction):
-        self.direction = direction
+        self.direction = direction.lower()
 
     def get_word(self):
         return self.word
 
-def turn(player, board, bag):
+    def get_location(self):
+        return self.location
+
+    def get_direction(self):
+        return self.direction
+
+def _read_placement(player, board):
+    """
+    Prompts the player for a word, its location and its direction until the
+    placement passes validation, and returns it as a Word.
+
+    The same Word is updated through its setters on every retry.
+    """
+    word = Word("", [-1, -1], player, "", board)
+    while True:
+        word.set_word(input("Word to play: "))
+        col = input("Column number: ")
+        row = input("Row number: ")
+        if col in _VALID_COORDS and row in _VALID_COORDS:
+            word.set_location([int(row), int(col)])
+        else:
+            word.set_location([-1, -1])
+        word.set_direction(input("Direction of word (right or down): "))
+
+        checked = word.check_word()
+        if checked == True:
+            return word
+        print(checked)
+
+def turn(board, bag):
     """
-    Manages a player's turn, including displaying the board, handling input,
-    and progressing to the next player's turn.
+    Manages the players' turns, starting with players[current_idx], including
+    displaying the board, handling input, and progressing to the next player's turn.
 
     Purpose:
     - Displays the current state of the board and the player's rack.
     - Provides a menu of actions (e.g., shuffle rack, renew rack, play a word).
     - Handles the process of placing a word, including validation and scoring.
-    - Updates the game state and moves to the next player's turn or ends the game.
+    - Updates the game state and moves to the next player's turn until the game ends.
     """
-    global round_number, players, skipped_turns
-
-    # Determine the minimum score threshold for this round
-    if round_number == 0:
-        score_threshold = round_number * 0
-    else:
-        score_threshold = (round_number-1) * 5
-
-    # Check if the player's score meets the threshold
-    if player.get_score() < score_threshold:
-        print(f"{RED_TEXT}{player.get_name()} has been eliminated for not reaching {score_threshold} points in round {round_number}.{RESET_TEXT}")
-        other_player = [p for p in players if p != player][0]
-        print(f"{CYAN_TEXT}{other_player.get_name()} wins the game!{RESET_TEXT}")
-        players.remove(player)  # Remove the player from the game
-
-        # If all players are eliminated, end the game
-        if len(players) == 0:
-            print(f"{RED_TEXT}All players have been eliminated! The game is over.{RESET_TEXT}")
-            end_game()
-            return
-
-        # Move to the next player
-        if players.index(player) != (len(players) - 1):
-            next_player = players[players.index(player) + 1]
-        else:
-            next_player = players[0]
-            round_number += 1
+    global round_number, players, skipped_turns, current_idx
+    player = players[current_idx]
 
-        turn(next_player, board, bag)
-        return
+    # Keep playing while fewer than 6 turns in a row were skipped
+    while skipped_turns < 6:
 
-    # Check if the game should continue based on skipped turns and tiles
-    if (skipped_turns < 6) or (player.rack.get_rack_length() == 0 and bag.get_remaining_tiles() == 0):
+        # Determine the minimum score threshold for this round
+        if round_number == 0:
+            score_threshold = round_number * 0
+        else:
+            score_threshold = (round_number-1) * 5
+
+        # Check if the player's score meets the threshold
+        if player.get_score() < score_threshold:
+            print(f"{RED_TEXT}{player.get_name()} has been eliminated for not reaching {score_threshold} points in round {round_number}.{RESET_TEXT}")
+            players.remove(player)  # Remove the player from the game
+
+            # If only one player is left, they win and the game ends
+            if len(players) == 1:
+                print(f"{CYAN_TEXT}{players[0].get_name()} wins the game!{RESET_TEXT}")
+                end_game()
+                return
+
+            # Move to the next player, who now holds the eliminated player's position
+            if current_idx == len(players):
+                current_idx = 0
+                round_number += 1
+            player = players[current_idx]
+            continue
 
         # Display round and player info
         print("\nRound " + str(round_number) + ": " + player.get_name() + "'s turn \n")
         print(board.get_board())
 
         # Player actions menu
+        skip_turn = False
         while True:
             print(player.get_name() + "'s Letter Rack: " + player.get_rack_str() + "\n")
             print("Command List")
@@ -513,8 +597,7 @@ def turn(player, board, bag):
                 print("\n" + "Your rack has been shuffled!")
 
             elif numm == "3":
-                player.rack.rack.clear()
-                player.rack.replenish_rack()
+                player.rack.renew_rack()
                 print("\n\n" + board.get_board())
                 print("\n" + "Your rack has been renewed!")
                 
@@ -525,15 +608,9 @@ def turn(player, board, bag):
                     print("\n")
                     continue
                 elif answer == "y":
-                    word_to_play = ""
                     skipped_turns += 1
-                    if players.index(player) != (len(players)-1):
-                        player = players[players.index(player)+1]
-                    else:
-                        player = players[0]
-                        round_number += 1
-                    turn(player, board, bag)
-                    return
+                    skip_turn = True
+                    break
                 else:
                     print("\n" + f"{RED_TEXT}please input a valid option{RESET_TEXT}")
                     
@@ -562,58 +639,30 @@ def turn(player, board, bag):
                 print("\n\n" + board.get_board())
                 print("\n" + f"{RED_TEXT}please input a valid option{RESET_TEXT}")
 
-        # Get word placement info from the player
-        word_to_play = input("Word to play: ")
-        location = []
-        col = input("Column number: ")
-        row = input("Row number: ")
-        if (col == "" or row == "") or (col not in [str(x) for x in range(15)] or row not in [str(x) for x in range(15)]):
-            location = [-1, -1]
-        else:
-            location = [int(row), int(col)]
-        direction = input("Direction of word (right or down): ")
-
-        word = Word(word_to_play, location, player, direction, board.board_array())
+        # Skipped turns go straight to the next player
+        if not skip_turn:
+            # Get word placement info from the player, asking again until it is valid
+            word = _read_placement(player, board)
 
-        #If the word throws an error, creates a recursive loop until the information is given correctly.
-        checked = word.check_word()
-        while checked != True:
-            print(checked)
-            word_to_play = input("Word to play: ")
-            word.set_word(word_to_play)
-            location = []
-            col = input("Column number: ")
-            row = input("Row number: ")
-            if (col == "" or row == "") or (col not in [str(x) for x in range(15)] or row not in [str(x) for x in range(15)]):
-                location = [-1, -1]
-            else:
-                word.set_location([int(row), int(col)])
-                location = [int(row), int(col)]
-            direction = input("Direction of word (right or down): ")
-            word.set_direction(direction)
-            checked = word.check_word()
+            # Place the word and update the game state
+            player.increase_score(board.place_word(word.get_word(), word.get_location(), word.get_direction(), player))
+            skipped_turns = 0
 
-        # Place the word and update the game state
-        board.place_word(word_to_play, location, direction, player)
-        word.calculate_word_score()
-        skipped_turns = 0
+            #Prints the current player's score
+            print("\n" + player.get_name() + "'s score is: " + str(player.get_score()))
 
-        #Prints the current player's score
-        print("\n" + player.get_name() + "'s score is: " + str(player.get_score()))
+            # The game ends as soon as a player uses their last tile while the bag is empty
+            if player.rack.get_rack_length() == 0 and bag.get_remaining_tiles() == 0:
+                break
 
         #Gets the next player.
-        if players.index(player) != (len(players)-1):
-            player = players[players.index(player)+1]
-        else:
-            player = players[0]
+        current_idx = (current_idx + 1) % len(players)
+        if current_idx == 0:
             round_number += 1
-
-        #Recursively calls the function in order to play the next turn.
-        turn(player, board, bag)
+        player = players[current_idx]
 
     #If the number of skipped turns is over 6 or the bag has both run out of tiles and a player is out of tiles, end the game.
-    else:
-        end_game()
+    end_game()
 
 def start_game():
     """
@@ -624,7 +673,7 @@ def start_game():
     - Prompts players for their names and initializes their racks.
     - Begins the first round of the game with player 1's turn.
     """
-    global round_number, players, skipped_turns
+    global round_number, players, skipped_turns, current_idx
     board = Board()
     bag = Bag()
 
@@ -657,8 +706,8 @@ def start_game():
     # Initialize game variables
     round_number = 1
     skipped_turns = 0
-    current_player = players[0]
-    turn(current_player, board, bag)
+    current_idx = 0  # Index in players of the player whose turn it is
+    turn(board, bag)
 
 def end_game():
     """
@@ -672,13 +721,8 @@ def end_game():
     global players
     
     # Determine the winner
-    highest_score = 0
-    winning_player = ""
-    for player in players:
-        if player.get_score > highest_score:
-            highest_score = player.get_score()
-            winning_player = player.get_name()
-    print("The game is over! " + winning_player + ", you have won!")
+    winning_player = max(players, key=Player.get_score)
+    print("The game is over! " + winning_player.get_name() + ", you have won!")
 
     if input("\nWould you like to play again? (y/n)").upper() == "Y":
         start_game()